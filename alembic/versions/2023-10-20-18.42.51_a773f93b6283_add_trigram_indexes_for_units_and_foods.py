@@ -0,0 +1,55 @@
+"""add trigram indexes for units and foods
+
+Revision ID: a773f93b6283
+Revises: dded3119c1fe
+Create Date: 2023-10-20 18:42:51.903216
+
+"""
+import sqlalchemy as sa
+
+import mealie.db.migration_types
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a773f93b6283"
+down_revision = "dded3119c1fe"
+branch_labels = None
+depends_on = None
+
+# these were declared on the models, but never created since the models only set them per instance
+TRGM_INDEXES = [
+    ("ix_ingredient_units_name_normalized_gin", "ingredient_units", "name_normalized"),
+    ("ix_ingredient_units_abbreviation_normalized_gin", "ingredient_units", "abbreviation_normalized"),
+    ("ix_ingredient_foods_name_normalized_gin", "ingredient_foods", "name_normalized"),
+]
+
+
+def _is_postgres():
+    return op.get_context().dialect.name == "postgresql"
+
+
+def upgrade():
+    if not _is_postgres():
+        return
+
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column in TRGM_INDEXES:
+            op.create_index(
+                index_name,
+                table_name=table_name,
+                columns=[column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={
+                    column: "gin_trgm_ops",
+                },
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    if not _is_postgres():
+        return
+
+    for index_name, table_name, _ in TRGM_INDEXES:
+        op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,47 @@
+"""drop btree indexes on normalized ingredient columns
+
+Revision ID: 775c21d9452b
+Revises: a773f93b6283
+Create Date: 2023-10-23 19:05:37.512840
+
+"""
+import sqlalchemy as sa
+
+import mealie.db.migration_types
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "775c21d9452b"
+down_revision = "a773f93b6283"
+branch_labels = None
+depends_on = None
+
+# searches on these columns are substring/trigram matches, which never use a btree index
+BTREE_INDEXES = [
+    ("ix_ingredient_units_name_normalized", "ingredient_units", "name_normalized"),
+    ("ix_ingredient_units_abbreviation_normalized", "ingredient_units", "abbreviation_normalized"),
+    ("ix_ingredient_foods_name_normalized", "ingredient_foods", "name_normalized"),
+    ("ix_recipes_ingredients_note_normalized", "recipes_ingredients", "note_normalized"),
+    ("ix_recipes_ingredients_original_text_normalized", "recipes_ingredients", "original_text_normalized"),
+]
+
+
+def _is_postgres():
+    return op.get_context().dialect.name == "postgresql"
+
+
+def upgrade():
+    if not _is_postgres():
+        for index_name, table_name, _ in BTREE_INDEXES:
+            op.drop_index(index_name, table_name=table_name)
+
+        return
+
+    with op.get_context().autocommit_block():
+        for index_name, _, _ in BTREE_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+
+def downgrade():
+    for index_name, table_name, column in BTREE_INDEXES:
+        op.create_index(index_name, table_name, [column], unique=False)
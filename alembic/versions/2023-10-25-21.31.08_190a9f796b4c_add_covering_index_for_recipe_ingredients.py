@@ -0,0 +1,47 @@
+"""add covering index for recipe ingredients
+
+Revision ID: 190a9f796b4c
+Revises: 775c21d9452b
+Create Date: 2023-10-25 21:31:08.640195
+
+"""
+import sqlalchemy as sa
+
+import mealie.db.migration_types
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "190a9f796b4c"
+down_revision = "775c21d9452b"
+branch_labels = None
+depends_on = None
+
+
+def _is_postgres():
+    return op.get_context().dialect.name == "postgresql"
+
+
+def upgrade():
+    if not _is_postgres():
+        op.create_index(
+            "ix_recipes_ingredients_recipe_id_pos",
+            "recipes_ingredients",
+            ["recipe_id", "position"],
+            unique=False,
+        )
+
+        return
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_recipes_ingredients_recipe_id_pos",
+            "recipes_ingredients",
+            ["recipe_id", "position"],
+            unique=False,
+            postgresql_include=["quantity", "food_id", "unit_id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    op.drop_index("ix_recipes_ingredients_recipe_id_pos", table_name="recipes_ingredients")
@@ -0,0 +1,33 @@
+"""cluster recipe ingredients by recipe
+
+Revision ID: d0884718bf93
+Revises: 190a9f796b4c
+Create Date: 2023-10-26 17:58:44.117302
+
+"""
+import sqlalchemy as sa
+
+import mealie.db.migration_types
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d0884718bf93"
+down_revision = "190a9f796b4c"
+branch_labels = None
+depends_on = None
+
+
+def _is_postgres():
+    return op.get_context().dialect.name == "postgresql"
+
+
+def upgrade():
+    # one-time rewrite; postgres remembers the index, so it can be repeated manually with `CLUSTER recipes_ingredients`.
+    # it locks the table and rebuilds all of its indexes, so it isn't scheduled
+    if _is_postgres():
+        op.execute("CLUSTER recipes_ingredients USING ix_recipes_ingredients_recipe_id_pos")
+
+
+def downgrade():
+    if _is_postgres():
+        op.execute("ALTER TABLE recipes_ingredients SET WITHOUT CLUSTER")
@@ -0,0 +1,38 @@
+"""use bigint for recipe ingredient ids
+
+Revision ID: 169bee941fdf
+Revises: d0884718bf93
+Create Date: 2023-10-27 20:09:15.378920
+
+"""
+import sqlalchemy as sa
+
+import mealie.db.migration_types
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "169bee941fdf"
+down_revision = "d0884718bf93"
+branch_labels = None
+depends_on = None
+
+
+def _is_postgres():
+    return op.get_context().dialect.name == "postgresql"
+
+
+def upgrade():
+    # sqlite integer primary keys are already 64-bit
+    if not _is_postgres():
+        return
+
+    op.alter_column("recipes_ingredients", "id", existing_type=sa.Integer(), type_=sa.BigInteger())
+    op.execute("ALTER SEQUENCE recipes_ingredients_id_seq AS BIGINT")
+
+
+def downgrade():
+    if not _is_postgres():
+        return
+
+    op.execute("ALTER SEQUENCE recipes_ingredients_id_seq AS INTEGER")
+    op.alter_column("recipes_ingredients", "id", existing_type=sa.BigInteger(), type_=sa.Integer())
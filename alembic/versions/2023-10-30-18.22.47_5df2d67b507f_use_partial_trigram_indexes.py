@@ -0,0 +1,60 @@
+"""use partial trigram indexes
+
+Revision ID: 5df2d67b507f
+Revises: 169bee941fdf
+Create Date: 2023-10-30 18:22:47.203915
+
+"""
+import sqlalchemy as sa
+
+import mealie.db.migration_types
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5df2d67b507f"
+down_revision = "169bee941fdf"
+branch_labels = None
+depends_on = None
+
+# rows with a NULL normalized value can never match a search, so they don't need index entries
+TRGM_INDEXES = [
+    ("ix_recipes_name_normalized_gin", "recipes", "name_normalized"),
+    ("ix_recipes_description_normalized_gin", "recipes", "description_normalized"),
+    ("ix_ingredient_units_name_normalized_gin", "ingredient_units", "name_normalized"),
+    ("ix_ingredient_units_abbreviation_normalized_gin", "ingredient_units", "abbreviation_normalized"),
+    ("ix_ingredient_foods_name_normalized_gin", "ingredient_foods", "name_normalized"),
+    ("ix_recipes_ingredients_note_normalized_gin", "recipes_ingredients", "note_normalized"),
+    ("ix_recipes_ingredients_original_text_normalized_gin", "recipes_ingredients", "original_text_normalized"),
+]
+
+
+def _is_postgres():
+    return op.get_context().dialect.name == "postgresql"
+
+
+def _recreate_indexes(partial: bool):
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column in TRGM_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+            op.create_index(
+                index_name,
+                table_name,
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={
+                    column: "gin_trgm_ops",
+                },
+                postgresql_where=sa.text(f"{column} IS NOT NULL") if partial else None,
+                postgresql_concurrently=True,
+            )
+
+
+def upgrade():
+    if _is_postgres():
+        _recreate_indexes(partial=True)
+
+
+def downgrade():
+    if _is_postgres():
+        _recreate_indexes(partial=False)
@@ -0,0 +1,45 @@
+"""add covering index for food labels
+
+Revision ID: 0329d221b57d
+Revises: 5df2d67b507f
+Create Date: 2023-10-31 19:47:12.861403
+
+"""
+import sqlalchemy as sa
+
+import mealie.db.migration_types
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0329d221b57d"
+down_revision = "5df2d67b507f"
+branch_labels = None
+depends_on = None
+
+
+def _is_postgres():
+    return op.get_context().dialect.name == "postgresql"
+
+
+def upgrade():
+    if not _is_postgres():
+        op.create_index("ix_ingredient_foods_label_id_name", "ingredient_foods", ["label_id"], unique=False)
+        op.drop_index("ix_ingredient_foods_label_id", table_name="ingredient_foods")
+
+        return
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_ingredient_foods_label_id_name",
+            "ingredient_foods",
+            ["label_id"],
+            unique=False,
+            postgresql_include=["name"],
+            postgresql_concurrently=True,
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_ingredient_foods_label_id")
+
+
+def downgrade():
+    op.create_index("ix_ingredient_foods_label_id", "ingredient_foods", ["label_id"], unique=False)
+    op.drop_index("ix_ingredient_foods_label_id_name", table_name="ingredient_foods")
@@ -0,0 +1,47 @@
+"""tune trigram index pending lists
+
+Revision ID: 442f605aec76
+Revises: 0329d221b57d
+Create Date: 2023-11-01 20:36:58.479126
+
+"""
+import sqlalchemy as sa
+
+import mealie.db.migration_types
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "442f605aec76"
+down_revision = "0329d221b57d"
+branch_labels = None
+depends_on = None
+
+TRGM_INDEXES = [
+    "ix_recipes_name_normalized_gin",
+    "ix_recipes_description_normalized_gin",
+    "ix_ingredient_units_name_normalized_gin",
+    "ix_ingredient_units_abbreviation_normalized_gin",
+    "ix_ingredient_foods_name_normalized_gin",
+    "ix_recipes_ingredients_note_normalized_gin",
+    "ix_recipes_ingredients_original_text_normalized_gin",
+]
+
+
+def _is_postgres():
+    return op.get_context().dialect.name == "postgresql"
+
+
+def upgrade():
+    if not _is_postgres():
+        return
+
+    for index_name in TRGM_INDEXES:
+        op.execute(f"ALTER INDEX {index_name} SET (fastupdate = on, gin_pending_list_limit = 16384)")
+
+
+def downgrade():
+    if not _is_postgres():
+        return
+
+    for index_name in TRGM_INDEXES:
+        op.execute(f"ALTER INDEX {index_name} RESET (fastupdate, gin_pending_list_limit)")
@@ -0,0 +1,74 @@
+"""add normalized food descriptions
+
+Revision ID: 4fad7edd3567
+Revises: 442f605aec76
+Create Date: 2023-11-02 18:03:26.915740
+
+"""
+import sqlalchemy as sa
+
+import mealie.db.migration_types
+from alembic import op
+from mealie.db.models._model_base import normalize
+
+# revision identifiers, used by Alembic.
+revision = "4fad7edd3567"
+down_revision = "442f605aec76"
+branch_labels = None
+depends_on = None
+
+
+def _is_postgres():
+    return op.get_context().dialect.name == "postgresql"
+
+
+def populate_description_normalized():
+    foods = sa.table(
+        "ingredient_foods",
+        sa.column("id"),
+        sa.column("description", sa.String),
+        sa.column("description_normalized", sa.String),
+    )
+
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(foods.c.id, foods.c.description).where(foods.c.description.isnot(None))).all()
+    if not rows:
+        return
+
+    bind.execute(
+        sa.update(foods)
+        .where(foods.c.id == sa.bindparam("food_id"))
+        .values(description_normalized=sa.bindparam("normalized")),
+        [{"food_id": food_id, "normalized": normalize(description)} for food_id, description in rows],
+    )
+
+
+def upgrade():
+    op.add_column("ingredient_foods", sa.Column("description_normalized", sa.String(), nullable=True))
+    populate_description_normalized()
+
+    if not _is_postgres():
+        return
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_ingredient_foods_description_normalized_gin",
+            "ingredient_foods",
+            ["description_normalized"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={
+                "description_normalized": "gin_trgm_ops",
+            },
+            postgresql_where=sa.text("description_normalized IS NOT NULL"),
+            postgresql_with={"fastupdate": "on", "gin_pending_list_limit": "16384"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    if _is_postgres():
+        with op.get_context().autocommit_block():
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_ingredient_foods_description_normalized_gin")
+
+    op.drop_column("ingredient_foods", "description_normalized")
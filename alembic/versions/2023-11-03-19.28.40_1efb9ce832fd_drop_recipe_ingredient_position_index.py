@@ -0,0 +1,36 @@
+"""drop recipe ingredient position index
+
+Revision ID: 1efb9ce832fd
+Revises: 4fad7edd3567
+Create Date: 2023-11-03 19:28:40.652193
+
+"""
+import sqlalchemy as sa
+
+import mealie.db.migration_types
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1efb9ce832fd"
+down_revision = "4fad7edd3567"
+branch_labels = None
+depends_on = None
+
+
+def _is_postgres():
+    return op.get_context().dialect.name == "postgresql"
+
+
+def upgrade():
+    # position is only ever queried together with recipe_id, which ix_recipes_ingredients_recipe_id_pos covers
+    if not _is_postgres():
+        op.drop_index("ix_recipes_ingredients_position", table_name="recipes_ingredients")
+
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_recipes_ingredients_position")
+
+
+def downgrade():
+    op.create_index("ix_recipes_ingredients_position", "recipes_ingredients", ["position"], unique=False)
@@ -58,6 +58,7 @@ async def start_scheduler():
         tasks.purge_group_data_exports,
         tasks.create_mealplan_timeline_events,
         tasks.delete_old_checked_list_items,
+        tasks.clean_gin_pending_lists,
     )
 
     SchedulerRegistry.register_minutely(
@@ -5,14 +5,17 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from text_unidecode import unidecode
 
 
+def normalize(val: str) -> str:
+    """Normalizes a value for searching, e.g. 'Crème Fraîche ' -> 'creme fraiche'"""
+    return unidecode(val).lower().strip()
+
+
 class SqlAlchemyBase(DeclarativeBase):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     created_at: Mapped[datetime | None] = mapped_column(DateTime, default=datetime.now, index=True)
     update_at: Mapped[datetime | None] = mapped_column(DateTime, default=datetime.now, onupdate=datetime.now)
 
-    @classmethod
-    def normalize(cls, val: str) -> str:
-        return unidecode(val).lower().strip()
+    normalize = staticmethod(normalize)
 
 
 class BaseMixins:
@@ -1,7 +1,9 @@
 from .auto_init import auto_init
 from .guid import GUID
+from .normalized_search import NormalizedSearchMixin
 
 __all__ = [
     "auto_init",
     "GUID",
+    "NormalizedSearchMixin",
 ]
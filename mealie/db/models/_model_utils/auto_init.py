@@ -66,6 +66,20 @@ def get_lookup_attr(relation_cls: type[SqlAlchemyBase]) -> str:
     return get_attr
 
 
+def get_existing_instance(session: Session, get_attr: str, relation_cls: type[SqlAlchemyBase], val):
+    """
+    Returns the instance of `relation_cls` where `get_attr` matches `val`, or None. When `get_attr` is the
+    primary key the session's identity map is checked first, so an instance referenced by many rows (e.g.
+    the same unit on several ingredients) is only queried once.
+    """
+    primary_key = relation_cls.__mapper__.primary_key
+    if len(primary_key) == 1 and primary_key[0].key == get_attr:
+        return session.get(relation_cls, val)
+
+    stmt = select(relation_cls).filter_by(**{get_attr: val})
+    return session.execute(stmt).scalars().one_or_none()
+
+
 def handle_many_to_many(session, get_attr, relation_cls, all_elements: list[dict]):
     """
     Proxy call to `handle_one_to_many_list` for many-to-many relationships. Because functionally, they do the same
@@ -83,8 +97,9 @@ def handle_one_to_many_list(
 
     for elem in all_elements:
         elem_id = elem.get(get_attr, None) if isinstance(elem, dict) else elem
-        stmt = select(relation_cls).filter_by(**{get_attr: elem_id})
-        existing_elem = session.execute(stmt).scalars().one_or_none()
+
+        # new elements don't have an id yet, so there is nothing to look up
+        existing_elem = None if elem_id is None else get_existing_instance(session, get_attr, relation_cls, elem_id)
 
         if existing_elem is None and isinstance(elem, dict):
             elems_to_create.append(elem)
@@ -175,8 +190,7 @@ def auto_init():  # sourcery no-metrics
                                 raise ValueError(f"Expected 'id' to be provided for {key}")
 
                         if isinstance(val, str | int | UUID):
-                            stmt = select(relation_cls).filter_by(**{get_attr: val})
-                            instance = session.execute(stmt).scalars().one_or_none()
+                            instance = get_existing_instance(session, get_attr, relation_cls, val)
                             setattr(self, key, instance)
                         else:
                             # If the value is not of the type defined above we assume that it isn't a valid id
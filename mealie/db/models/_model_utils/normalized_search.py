@@ -0,0 +1,65 @@
+from collections.abc import Callable
+from typing import ClassVar
+
+import sqlalchemy as sa
+from sqlalchemy import event
+
+from mealie.core.config import get_app_settings
+
+from .._model_base import normalize
+
+# the trigram indexes are DDL, so the engine only has to be checked once when the models are defined
+_IS_POSTGRES = get_app_settings().DB_ENGINE == "postgres"
+
+# gin_pending_list_limit is in kB
+_GIN_STORAGE_PARAMS = {"fastupdate": "on", "gin_pending_list_limit": "16384"}
+
+
+def _normalize_on_set(normalized_attr: str) -> Callable:
+    def receive_set(target, value: str | None, oldvalue, initiator):
+        # `update` re-assigns every field, most of them unchanged; rows being loaded never fire set events.
+        # oldvalue is only a str when it was already loaded, otherwise it's an unset/not-loaded marker
+        if value == oldvalue:
+            return
+
+        setattr(target, normalized_attr, None if value is None else normalize(value))
+
+    return receive_set
+
+
+class NormalizedSearchMixin:
+    """
+    Keeps a `<field>_normalized` column in sync with each field in `_normalized_fields`, which is what
+    searches filter on. On postgres each normalized column also gets a GIN trigram index for fuzzy search.
+
+    The model must declare the `<field>_normalized` columns itself, and list this mixin after `SqlAlchemyBase`
+    in its bases.
+    """
+
+    _normalized_fields: ClassVar[tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        # DeclarativeBase.__init_subclass__ maps the class and then calls super(), which reaches this method
+        # because the mixin comes after SqlAlchemyBase in the bases, so the table and attributes already exist here
+        super().__init_subclass__(**kwargs)
+
+        for field in cls._normalized_fields:
+            normalized_attr = f"{field}_normalized"
+            event.listen(getattr(cls, field), "set", _normalize_on_set(normalized_attr))
+
+            if _IS_POSTGRES:
+                # binding the index to the table's column attaches it to the table
+                column = cls.__table__.c[normalized_attr]
+                sa.Index(
+                    f"ix_{cls.__tablename__}_{normalized_attr}_gin",
+                    column,
+                    unique=False,
+                    postgresql_using="gin",
+                    postgresql_ops={
+                        normalized_attr: "gin_trgm_ops",
+                    },
+                    # rows without a value can never match a search, so they're left out of the index
+                    postgresql_where=column.isnot(None),
+                    # buffer inserts so bulk imports don't pay for the index updates, see `clean_gin_pending_lists`
+                    postgresql_with=_GIN_STORAGE_PARAMS,
+                )
@@ -3,14 +3,13 @@ from typing import TYPE_CHECKING
 
 import sqlalchemy as sa
 import sqlalchemy.orm as orm
-from sqlalchemy import event
 from sqlalchemy.ext.orderinglist import ordering_list
 from sqlalchemy.orm import Mapped, mapped_column, validates
 
 from mealie.db.models._model_utils.guid import GUID
 
 from .._model_base import BaseMixins, SqlAlchemyBase
-from .._model_utils import auto_init
+from .._model_utils import NormalizedSearchMixin, auto_init
 from ..users.user_to_favorite import users_to_favorites
 from .api_extras import ApiExtras, api_extras
 from .assets import RecipeAsset
@@ -32,11 +31,12 @@ if TYPE_CHECKING:
     from . import Category, Tag, Tool
 
 
-class RecipeModel(SqlAlchemyBase, BaseMixins):
+class RecipeModel(SqlAlchemyBase, BaseMixins, NormalizedSearchMixin):
     __tablename__ = "recipes"
     __table_args__: tuple[sa.UniqueConstraint, ...] = (
         sa.UniqueConstraint("slug", "group_id", name="recipe_slug_group_id_key"),
     )
+    _normalized_fields = ("name", "description")
 
     id: Mapped[GUID] = mapped_column(GUID, primary_key=True, default=GUID.generate)
     slug: Mapped[str | None] = mapped_column(sa.String, index=True)
@@ -131,7 +131,7 @@ class RecipeModel(SqlAlchemyBase, BaseMixins):
         cascade="all, delete-orphan",
     )
 
-    # Automatically updated by sqlalchemy event, do not write to this manually
+    # Automatically updated by NormalizedSearchMixin, do not write to this manually
     name_normalized: Mapped[str] = mapped_column(sa.String, nullable=False, index=True)
     description_normalized: Mapped[str | None] = mapped_column(sa.String, index=True)
 
@@ -158,8 +158,6 @@ class RecipeModel(SqlAlchemyBase, BaseMixins):
     def __init__(
         self,
         session,
-        name: str | None = None,
-        description: str | None = None,
         assets: list | None = None,
         notes: list[dict] | None = None,
         nutrition: dict | None = None,
@@ -185,63 +183,3 @@ class RecipeModel(SqlAlchemyBase, BaseMixins):
             self.notes = [Note(**n) for n in notes]
 
         self.date_updated = datetime.now()
-
-        # SQLAlchemy events do not seem to register things that are set during auto_init
-        if name is not None:
-            self.name_normalized = self.normalize(name)
-
-        if description is not None:
-            self.description_normalized = self.normalize(description)
-
-        tableargs = [  # base set of indices
-            sa.UniqueConstraint("slug", "group_id", name="recipe_slug_group_id_key"),
-            sa.Index(
-                "ix_recipes_name_normalized",
-                "name_normalized",
-                unique=False,
-            ),
-            sa.Index(
-                "ix_recipes_description_normalized",
-                "description_normalized",
-                unique=False,
-            ),
-        ]
-
-        if session.get_bind().name == "postgresql":
-            tableargs.extend(
-                [
-                    sa.Index(
-                        "ix_recipes_name_normalized_gin",
-                        "name_normalized",
-                        unique=False,
-                        postgresql_using="gin",
-                        postgresql_ops={
-                            "name_normalized": "gin_trgm_ops",
-                        },
-                    ),
-                    sa.Index(
-                        "ix_recipes_description_normalized_gin",
-                        "description_normalized",
-                        unique=False,
-                        postgresql_using="gin",
-                        postgresql_ops={
-                            "description_normalized": "gin_trgm_ops",
-                        },
-                    ),
-                ]
-            )
-        # add indices
-        self.__table_args__ = tuple(tableargs)
-
-
-@event.listens_for(RecipeModel.name, "set")
-def receive_name(target: RecipeModel, value: str, oldvalue, initiator):
-    target.name_normalized = RecipeModel.normalize(value)
-
-
-@event.listens_for(RecipeModel.description, "set")
-def receive_description(target: RecipeModel, value: str, oldvalue, initiator):
-    if value is not None:
-        target.description_normalized = RecipeModel.normalize(value)
-    else:
-        target.description_normalized = None
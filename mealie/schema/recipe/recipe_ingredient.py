@@ -51,7 +51,7 @@ class IngredientFood(CreateIngredientFood):
     created_at: datetime.datetime | None
     update_at: datetime.datetime | None
 
-    _searchable_properties: ClassVar[list[str]] = ["name_normalized"]
+    _searchable_properties: ClassVar[list[str]] = ["name_normalized", "description_normalized"]
     _normalize_search: ClassVar[bool] = True
 
     class Config:
@@ -1,3 +1,4 @@
+from .clean_gin_pending_lists import clean_gin_pending_lists
 from .create_timeline_events import create_mealplan_timeline_events
 from .delete_old_checked_shopping_list_items import delete_old_checked_list_items
 from .post_webhooks import post_group_webhooks
@@ -7,6 +8,7 @@ from .purge_registration import purge_group_registration
 from .reset_locked_users import locked_user_reset
 
 __all__ = [
+    "clean_gin_pending_lists",
     "create_mealplan_timeline_events",
     "delete_old_checked_list_items",
     "post_group_webhooks",
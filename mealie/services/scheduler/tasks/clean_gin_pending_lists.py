@@ -0,0 +1,31 @@
+from sqlalchemy import func, select
+
+from mealie.core import root_logger
+from mealie.db.db_setup import session_context
+from mealie.db.models._model_base import SqlAlchemyBase
+
+logger = root_logger.get_logger()
+
+
+def clean_gin_pending_lists():
+    """
+    Moves the entries buffered in the pending lists of the GIN (trigram) indexes into the main index
+    structure, so searches don't have to scan them and imports don't have to flush them.
+    """
+    with session_context() as session:
+        if session.get_bind().name != "postgresql":
+            return
+
+        index_names = [
+            index.name
+            for table in SqlAlchemyBase.metadata.sorted_tables
+            for index in table.indexes
+            if index.dialect_options["postgresql"]["using"] == "gin"
+        ]
+
+        logger.debug("cleaning GIN pending lists")
+        for index_name in index_names:
+            session.execute(select(func.gin_clean_pending_list(func.to_regclass(index_name))))
+
+        session.commit()
+        logger.info(f"GIN pending lists cleaned for {len(index_names)} indexes")
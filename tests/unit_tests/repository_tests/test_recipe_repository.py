@@ -2,10 +2,12 @@ from datetime import datetime
 from typing import cast
 
 import pytest
+from sqlalchemy import event, select
 
+from mealie.db.models.recipe.ingredient import RecipeIngredientModel
 from mealie.repos.repository_factory import AllRepositories
 from mealie.repos.repository_recipes import RepositoryRecipes
-from mealie.schema.recipe import RecipeIngredient, SaveIngredientFood
+from mealie.schema.recipe import RecipeIngredient, SaveIngredientFood, SaveIngredientUnit
 from mealie.schema.recipe.recipe import Recipe, RecipeCategory, RecipeSummary
 from mealie.schema.recipe.recipe_category import CategoryOut, CategorySave, TagSave
 from mealie.schema.recipe.recipe_tool import RecipeToolSave
@@ -658,3 +660,56 @@ def test_random_order_recipe_search(
         pagination.pagination_seed = str(datetime.now())
         random_ordered.append(repo.page_all(pagination, search="soup").items)
     assert not all(i == random_ordered[0] for i in random_ordered)
+
+
+def test_recipe_ingredient_normalized_fields(
+    database: AllRepositories, unique_local_group_id: str, unique_local_user_id: str
+):
+    recipe = database.recipes.create(
+        Recipe(
+            user_id=unique_local_user_id,
+            group_id=unique_local_group_id,
+            name=random_string(),
+            recipe_ingredient=[
+                RecipeIngredient(note="Crème Fraîche", original_text="1 Cup Crème Fraîche"),
+            ],
+        )
+    )
+
+    stmt = select(RecipeIngredientModel).filter_by(recipe_id=recipe.id)
+    ingredient = database.session.execute(stmt).scalars().one()
+
+    assert ingredient.note_normalized == "creme fraiche"
+    assert ingredient.original_text_normalized == "1 cup creme fraiche"
+
+
+def test_recipe_ingredients_share_unit_and_food_lookups(
+    database: AllRepositories, unique_local_group_id: str, unique_local_user_id: str
+):
+    unit = database.ingredient_units.create(SaveIngredientUnit(name=random_string(), group_id=unique_local_group_id))
+    food = database.ingredient_foods.create(SaveIngredientFood(name=random_string(), group_id=unique_local_group_id))
+    database.session.expunge_all()
+
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement: str, *args) -> None:
+        statements.append(statement)
+
+    engine = database.session.get_bind()
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        database.recipes.create(
+            Recipe(
+                user_id=unique_local_user_id,
+                group_id=unique_local_group_id,
+                name=random_string(),
+                recipe_ingredient=[RecipeIngredient(unit=unit, food=food, note=random_string()) for _ in range(10)],
+            )
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+
+    # one lookup by id shared by all ingredients, plus the selectin load when the saved recipe is refreshed
+    for table in ["ingredient_units", "ingredient_foods"]:
+        selects = [s for s in statements if s.lstrip().upper().startswith("SELECT") and f"FROM {table}" in s]
+        assert len(selects) <= 2
@@ -3,7 +3,7 @@ from datetime import datetime
 import pytest
 
 from mealie.repos.repository_factory import AllRepositories
-from mealie.schema.recipe.recipe_ingredient import IngredientUnit, SaveIngredientUnit
+from mealie.schema.recipe.recipe_ingredient import IngredientUnit, SaveIngredientFood, SaveIngredientUnit
 from mealie.schema.response.pagination import OrderDirection, PaginationQuery
 from mealie.schema.user.user import GroupBase
 from tests.utils.factories import random_int, random_string
@@ -99,6 +99,22 @@ def test_basic_search(
             assert unit.name == name
 
 
+@pytest.mark.parametrize("search", ["jalapeño", "jalapeno", "JALAPEÑO"])
+def test_food_search_by_description(search: str, database: AllRepositories, unique_local_group_id: str):
+    database.ingredient_foods.create_many(
+        [
+            SaveIngredientFood(group_id=unique_local_group_id, name="Pepper", description="Jalapeño, Sliced"),
+            SaveIngredientFood(group_id=unique_local_group_id, name="Salt", description="Fine"),
+        ]
+    )
+
+    repo = database.ingredient_foods.by_group(unique_local_group_id)
+    pagination = PaginationQuery(page=1, per_page=-1, order_by="created_at", order_direction=OrderDirection.asc)
+    results = repo.page_all(pagination, search=search).items
+
+    assert [food.name for food in results] == ["Pepper"]
+
+
 def test_fuzzy_search(
     database: AllRepositories,
     search_units: list[IngredientUnit],  # required so database is populated
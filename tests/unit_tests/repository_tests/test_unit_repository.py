@@ -1,3 +1,4 @@
+from mealie.db.models.recipe.ingredient import IngredientUnitModel
 from mealie.repos.repository_factory import AllRepositories
 from mealie.schema.recipe.recipe import Recipe
 from mealie.schema.recipe.recipe_ingredient import RecipeIngredient, SaveIngredientUnit
@@ -46,3 +47,34 @@ def test_unit_merger(database: AllRepositories, unique_user: TestUser):
 
     for ingredient in recipe.recipe_ingredient:
         assert ingredient.unit.id == unit_1.id  # type: ignore
+
+
+def test_unit_normalized_fields_on_update(database: AllRepositories, unique_user: TestUser):
+    unit = database.ingredient_units.create(
+        SaveIngredientUnit(
+            name="Cúp",
+            abbreviation="Çp",
+            group_id=unique_user.group_id,
+        )
+    )
+
+    def get_model() -> IngredientUnitModel:
+        database.session.expire_all()
+        model = database.session.get(IngredientUnitModel, unit.id)
+        assert model
+        return model
+
+    unit.name = "Tâblespoon"
+    database.ingredient_units.update(unit.id, unit)
+
+    model = get_model()
+    assert model.name_normalized == "tablespoon"
+    assert model.abbreviation_normalized == "cp"
+
+    # the unit schemas don't allow a null abbreviation, so clear it on the model directly
+    model.abbreviation = None
+    database.session.flush()
+
+    assert model.name_normalized == "tablespoon"
+    assert model.abbreviation_normalized is None
+    database.session.rollback()
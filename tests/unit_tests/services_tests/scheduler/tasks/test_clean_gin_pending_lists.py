@@ -0,0 +1,21 @@
+from mealie.repos.repository_factory import AllRepositories
+from mealie.schema.recipe.recipe_ingredient import SaveIngredientFood
+from mealie.schema.response.pagination import PaginationQuery
+from mealie.services.scheduler.tasks.clean_gin_pending_lists import clean_gin_pending_lists
+from tests.utils.factories import random_string
+from tests.utils.fixture_schemas import TestUser
+
+
+def test_no_gin_indexes():
+    # make sure this task runs successfully even if it doesn't do anything, e.g. on sqlite
+    clean_gin_pending_lists()
+
+
+def test_search_after_clean(database: AllRepositories, unique_user: TestUser):
+    food = database.ingredient_foods.create(SaveIngredientFood(name=random_string(), group_id=unique_user.group_id))
+    clean_gin_pending_lists()
+
+    # on postgres the pending list entry for the new food is now in the trigram index itself
+    repo = database.ingredient_foods.by_group(unique_user.group_id)
+    results = repo.page_all(PaginationQuery(page=1, per_page=-1), search=food.name).items
+    assert food.id in [result.id for result in results]